@@ -2,11 +2,22 @@
 # Streamlit app: PV Finder – Intelligent Packaging Specification Search (PepsiCo-themed)
 
 import io
+import os
+import functools
+import hashlib
+import logging
 import datetime as dt
 from typing import List, Dict
 import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
+import xlsxwriter
+
+# Kernels live in their own module so Streamlit reruns reuse them instead of re-decorating.
+from pv_kernels import and_in_range, contains_rows
 
 # =========================
 # Required columns & aliases
@@ -18,6 +29,15 @@ REQUIRED_COLUMNS: List[str] = [
     "TotalNumberOfCasesPerPallet","BagsOrTraysPerLayer",
 ]
 
+BASIC_FILTER_COLUMNS: List[str] = [
+    "PVNumber","PVStatus","DocumentType","CaseTypeDescriptor","SalesClass","Shape","Size",
+]
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORY_COLUMNS: List[str] = [
+    "PVStatus","DocumentType","CaseTypeDescriptor","SalesClass","Shape","AirFillDescriptor",
+]
+
 HEADER_ALIASES: Dict[str, str] = {
     "PVNumber": r"pv number|pv_number|pv no|pvno|pv num|pv id",
     "PVStatus": r"pv status|status|pv details|pv_status",
@@ -36,6 +56,27 @@ HEADER_ALIASES: Dict[str, str] = {
     "BagsOrTraysPerLayer": r"bags per layer|trays per layer|bags_or_trays_per_layer|bags/trays per layer",
 }
 
+# One alternation for all aliases; group names are positional since canonical
+# names such as "CasesPerLayer(TI)" are not valid identifiers.
+_ALIAS_CANONS: List[str] = list(HEADER_ALIASES)
+ALIAS_REGEX = re.compile(
+    "|".join(f"(?P<a{i}>{HEADER_ALIASES[c]})" for i, c in enumerate(_ALIAS_CANONS)),
+    re.IGNORECASE,
+)
+
+# "regex" is opt-in; every other text operator matches literal substrings/values.
+ADV_OPERATORS: List[str] = ["(none)", "contains", "equals", "in list", "regex"]
+
+LOWER_PREFIX = "_lc_"  # hidden lowercase copy of each required column
+DOWNLOAD_CACHE_ENTRIES = 4  # serialized result sets kept per download format
+BASE_CACHE_ENTRIES = 2  # uploaded bases (and their derived indexes) kept in memory
+PAGE_SIZE = 100  # rows sent to the browser per results page
+SHRINK_THRESHOLD = 0.2  # below this surviving fraction, substring filters only scan survivors
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_VERSION = 3  # bump when the normalized layout changes so stale sidecars are ignored
+
 st.set_page_config(page_title="PV Finder – Packaging Specs", layout="wide")
 
 PEPSICO_BLUE = "#004C97"
@@ -58,47 +99,243 @@ def _strip_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 def _apply_header_aliases(df: pd.DataFrame) -> pd.DataFrame:
     rename_map = {}
-    lowered = {c.lower(): c for c in df.columns}
-    for canon, pattern in HEADER_ALIASES.items():
-        if canon in df.columns:
+    taken = set(df.columns)
+    for orig in df.columns:
+        m = ALIAS_REGEX.fullmatch(orig.lower())
+        if m is None:
             continue
-        regex = re.compile(rf"^(?:{pattern})$", re.IGNORECASE)
-        for low, orig in lowered.items():
-            if regex.match(low):
-                rename_map[orig] = canon
-                break
+        canon = _ALIAS_CANONS[int(m.lastgroup[1:])]
+        if canon not in taken:
+            rename_map[orig] = canon
+            taken.add(canon)
     return df.rename(columns=rename_map)
 
 def _ensure_required(df: pd.DataFrame) -> pd.DataFrame:
-    for col in REQUIRED_COLUMNS:
-        if col not in df.columns:
-            df[col] = pd.NA
-    return df[REQUIRED_COLUMNS].copy()
+    # Single reindex: selects the required columns and adds missing ones (as NaN) in one block insertion.
+    if df.columns.has_duplicates:
+        df = df.loc[:, ~df.columns.duplicated()]
+    return df.reindex(columns=REQUIRED_COLUMNS)
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    # Categories hold the str() form so filters can compare against widget values directly;
+    # blanks stay missing (not a "nan" category) and object categories survive parquet as-is.
+    for col in CATEGORY_COLUMNS:
+        series = df[col]
+        df[col] = series.where(series.isna(), series.astype(str)).astype("category")
+    return df
 
 def _parse_code_date_numeric(df: pd.DataFrame) -> pd.DataFrame:
     if "CodeDate" in df.columns:
-        df["CodeDate_num"] = pd.to_numeric(df["CodeDate"], errors="coerce")
+        df["CodeDate_num"] = pd.to_numeric(df["CodeDate"], errors="coerce").astype("float64")
     else:
-        df["CodeDate_num"] = pd.NA
+        df["CodeDate_num"] = np.nan
+    cd = df["CodeDate_num"]
+    # Slider bounds, cached with the frame so reruns never rescan the column.
+    df.attrs["codedate_range"] = [float(cd.min()), float(cd.max())] if cd.notna().any() else None
     return df
 
 def _latest_per_pv_flag(df: pd.DataFrame) -> pd.DataFrame:
+    df["IsLatestPerPV"] = False
     if "PVNumber" not in df.columns:
-        df["IsLatestPerPV"] = False
         return df
-    tmp = df.copy()
-    tmp.sort_values(["PVNumber","CodeDate_num"], ascending=[True,False], inplace=True)
-    tmp["IsLatestPerPV"] = ~tmp.duplicated(subset=["PVNumber"], keep="first")
-    return tmp
+    # -inf keeps PVs without any CodeDate: their first row counts as latest.
+    # dropna=False: blank PVNumbers form one group, as duplicated() treated them.
+    code_dates = df["CodeDate_num"].fillna(-np.inf)
+    latest_idx = code_dates.groupby(df["PVNumber"], sort=False, dropna=False, observed=True).idxmax()
+    df.loc[latest_idx, "IsLatestPerPV"] = True
+    return df
 
-def _download_xlsx(df: pd.DataFrame, filename: str):
+def _read_excel(file_bytes: bytes) -> pd.DataFrame:
+    try:
+        return pd.read_excel(io.BytesIO(file_bytes), engine="calamine")
+    except ImportError:
+        # python-calamine wheel not available on this machine
+        return pd.read_excel(io.BytesIO(file_bytes), engine="openpyxl")
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    df = _apply_header_aliases(df)
+    df = _ensure_required(df)
+    df = _categorize(df)
+    df = _parse_code_date_numeric(df)
+    df = _latest_per_pv_flag(df)
+    df = _add_search_blob(df)
+    df = _add_lower_views(df)
+    return df
+
+def _stringify_mixed(df: pd.DataFrame) -> pd.DataFrame:
+    # Excel columns often mix numbers and text (e.g. PVNumber, Size); parquet cannot
+    # store those, so keep them as their str() form, blanks stay missing. Done on the
+    # in-memory frame too so a sidecar reload matches a fresh parse.
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) in ("mixed", "mixed-integer"):
+            df[col] = series.where(series.isna(), series.astype(str))
+    return df
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    # The base is shared across reruns and sessions, so rebuild it on read-only
+    # per-column arrays: in-place writes raise instead of corrupting the cache.
+    cols = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy().copy()
+            codes.flags.writeable = False
+            cols[col] = pd.Categorical.from_codes(codes, dtype=series.dtype)
+        elif isinstance(series.dtype, np.dtype):
+            values = series.to_numpy(copy=True)
+            values.flags.writeable = False
+            cols[col] = values
+        else:
+            # Not reached by the normalized layout (the _lc_ views are object arrays); any other
+            # extension array would be shared as-is and stay writable.
+            cols[col] = series.array
+    frozen = pd.DataFrame(cols, index=df.index, copy=False)
+    frozen.attrs = df.attrs
+    return frozen
+
+@st.cache_resource(show_spinner=False, max_entries=BASE_CACHE_ENTRIES)
+def load_and_normalize(file_bytes: bytes) -> pd.DataFrame:
+    # Keyed on the upload content; the parquet sidecar survives server restarts.
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    sidecar = os.path.join(CACHE_DIR, f"{digest}.v{CACHE_VERSION}.parquet")
+    if os.path.exists(sidecar):
+        try:
+            return _freeze(pd.read_parquet(sidecar))
+        except Exception:
+            pass
+    df = _stringify_mixed(_normalize(_read_excel(file_bytes)))
+    df.attrs["upload_sha256"] = digest
+    tmp_path = f"{sidecar}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, sidecar)
+    except Exception:
+        log.warning("Could not write parquet sidecar %s", sidecar, exc_info=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return _freeze(df)
+
+def _as_text(series: pd.Series) -> pd.Series:
+    # The str() form the filters match against; blanks render as "nan" like astype(str)
+    # does on the raw columns (a categorical would give NaN/"<NA>" instead).
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+        return series.where(series.notna(), "nan").astype(str)
+    return series.astype(str)
+
+def _add_search_blob(df: pd.DataFrame) -> pd.DataFrame:
+    # One pre-lowered haystack per row; \x1f keeps matches from spanning two cells.
+    text = [_as_text(df[c]) for c in REQUIRED_COLUMNS]
+    df["_search_blob"] = text[0].str.cat(text[1:], sep="\x1f").str.lower()
+    return df
+
+def _add_lower_views(df: pd.DataFrame) -> pd.DataFrame:
+    lowered = {LOWER_PREFIX + c: _as_text(df[c]).str.lower() for c in REQUIRED_COLUMNS}
+    return df.assign(**lowered)
+
+def _column_options(series: pd.Series) -> List[str]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Inferred categories are already unique and sorted: O(cardinality), not O(rows).
+        return series.cat.categories.astype(str).tolist()
+    return sorted(series.dropna().astype(str).unique().tolist())
+
+@st.cache_resource(show_spinner=False, max_entries=BASE_CACHE_ENTRIES)
+def _filter_options(digest: str, _df: pd.DataFrame) -> Dict[str, List[str]]:
+    # Kept out of df.attrs: pandas deep-copies attrs on every derived frame/column access.
+    return {
+        col: _column_options(_df[col]) for col in BASIC_FILTER_COLUMNS if col in _df.columns
+    }
+
+@functools.lru_cache(maxsize=256)  # in-process memo; st.cache_data's hashing/pickling costs more than the split
+def _parse_in_list(val: str) -> tuple:
+    return tuple(v.strip() for v in val.split(";") if v.strip())
+
+def _as_bool(pred: pd.Series) -> np.ndarray:
+    return pred.to_numpy(dtype=bool, na_value=False)
+
+def _and_contains(mask: np.ndarray, series: pd.Series, needle: str, regex: bool = False) -> None:
+    kwargs = {"regex": regex, "na": False}
+    if regex:
+        kwargs["flags"] = re.IGNORECASE
+    if mask.sum() < SHRINK_THRESHOLD * len(mask):
+        rows = np.flatnonzero(mask)
+        mask[rows] = _as_bool(series.iloc[rows].str.contains(needle, **kwargs))
+    else:
+        np.logical_and(mask, _as_bool(series.str.contains(needle, **kwargs)), out=mask)
+
+@st.cache_resource(show_spinner=False, max_entries=BASE_CACHE_ENTRIES)
+def _search_index(digest: str, _blob: pd.Series):
+    # Packs every row's search blob into one contiguous UTF-8 buffer plus row offsets.
+    encoded = [b.encode("utf-8") if isinstance(b, str) else str(b).encode("utf-8") for b in _blob.tolist()]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    hay = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return hay, offsets
+
+def _and_search(mask: np.ndarray, base: pd.DataFrame, q: str) -> None:
+    if contains_rows is None:
+        _and_contains(mask, base["_search_blob"], q)
+        return
+    hay, offsets = _search_index(base.attrs["upload_sha256"], base["_search_blob"])
+    rows = np.flatnonzero(mask)
+    needle = np.frombuffer(q.encode("utf-8"), dtype=np.uint8)
+    mask[rows] = contains_rows(hay, offsets, rows, needle)
+
+def _latest_rows(base: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+    # Latest row per PVNumber among the filtered rows only: O(len(rows)), no sort.
+    code_dates = pd.Series(base["CodeDate_num"].to_numpy()[rows], index=rows).fillna(-np.inf)
+    pv = base["PVNumber"].to_numpy()[rows]
+    latest = code_dates.groupby(pv, sort=False, dropna=False).idxmax()
+    return np.sort(latest.to_numpy(dtype=np.int64))
+
+def _display_frame(base: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+    subset = base.iloc[rows]
+    return subset[REQUIRED_COLUMNS].assign(**{"CodeDate (num)": subset["CodeDate_num"].values})
+
+def _frame_fingerprint(df: pd.DataFrame):
+    # Digest of the row hashes in order: a sum would match the same rows in another order.
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return (len(df), tuple(df.columns), hashlib.sha1(row_hashes.tobytes()).hexdigest())
+
+@st.cache_data(show_spinner=False, max_entries=DOWNLOAD_CACHE_ENTRIES, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _xlsx_bytes(df: pd.DataFrame) -> bytes:
     out = io.BytesIO()
-    with pd.ExcelWriter(out, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Results")
-    st.download_button("⬇️ Download XLSX", data=out.getvalue(), file_name=filename, mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+    options = {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+        "default_date_format": "yyyy-mm-dd",
+    }
+    # constant_memory flushes each row once the next one starts, so cells must be
+    # written row by row; pandas' to_excel writes column by column, hence the direct loop.
+    with xlsxwriter.Workbook(out, options) as wb:
+        ws = wb.add_worksheet("Results")
+        ws.write_row(0, 0, [str(c) for c in df.columns])
+        # Blanks (NaN/NaT/NA) become empty cells; converted per row to avoid an object copy of the frame.
+        for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            ws.write_row(r, 0, [None if pd.isna(v) else v for v in row])
+    return out.getvalue()
+
+def _download_xlsx(df: pd.DataFrame, filename: str):
+    st.download_button("⬇️ Download XLSX", data=_xlsx_bytes(df), file_name=filename, mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+@st.cache_data(show_spinner=False, max_entries=DOWNLOAD_CACHE_ENTRIES, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    buf = pa.BufferOutputStream()
+    try:
+        # Arrow would print timestamps as "2024-01-01 00:00:00.000000000"; pre-format them as to_csv does.
+        dates = {c: s.astype(str).where(s.notna()) for c, s in df.items() if pd.api.types.is_datetime64_any_dtype(s.dtype)}
+        pacsv.write_csv(pa.Table.from_pandas(df.assign(**dates), preserve_index=False), buf)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g. mixed-type object columns Arrow cannot infer a type for
+        return df.to_csv(index=False).encode("utf-8-sig")
+    return b"\xef\xbb\xbf" + buf.getvalue().to_pybytes()
 
 def _download_csv(df: pd.DataFrame, filename: str):
-    csv = df.to_csv(index=False).encode("utf-8-sig")
+    csv = _csv_bytes(df)
     st.download_button("⬇️ Download CSV", data=csv, file_name=filename, mime="text/csv")
 
 st.sidebar.header("Admin – Weekly Upload")
@@ -116,13 +353,7 @@ if allow_upload:
     up = st.sidebar.file_uploader("Upload Excel (.xlsx)", type=["xlsx"])
     if up is not None:
         try:
-            df = pd.read_excel(up)
-            df = _strip_columns(df)
-            df = _apply_header_aliases(df)
-            df = _ensure_required(df)
-            df = _parse_code_date_numeric(df)
-            df = _latest_per_pv_flag(df)
-            uploaded_df = df
+            uploaded_df = load_and_normalize(up.getvalue())
             st.session_state.last_updated = dt.datetime.now().strftime("%Y-%m-%d %H:%M")
             st.sidebar.success("Base loaded successfully!")
         except Exception as e:
@@ -163,7 +394,7 @@ with c3:
         st.session_state.date_range = d.get("date_range",None)
         st.success("Defaults loaded.")
 
-base = uploaded_df.copy()
+base = uploaded_df
 
 st.text_input(
     "Global search (fragment across ALL columns)",
@@ -175,10 +406,11 @@ st.subheader("Basic column filters (optional)")
 _bf = st.session_state.get("basic_filters", {})
 new_bf = {}
 
-basic_cols = ["PVNumber","PVStatus","DocumentType","CaseTypeDescriptor","SalesClass","Shape","Size"]
+basic_cols = BASIC_FILTER_COLUMNS
+basic_options = _filter_options(base.attrs["upload_sha256"], base)
 bcols = st.columns(len(basic_cols))
 for i, col in enumerate(basic_cols):
-    options = sorted(base[col].dropna().astype(str).unique()) if col in base.columns else []
+    options = basic_options.get(col, [])
     with bcols[i]:
         new_bf[col] = st.multiselect(col, options, default=_bf.get(col, []))
 st.session_state.basic_filters = new_bf
@@ -192,8 +424,8 @@ with st.expander("Advanced filters (choose any column)", expanded=False):
         with cc1:
             mode = st.selectbox(
                 f"{col} operator",
-                ["(none)", "contains", "equals", "in list"],
-                index=["(none)", "contains", "equals", "in list"].index(_af.get(col, {}).get("mode","(none)"))
+                ADV_OPERATORS,
+                index=ADV_OPERATORS.index(_af.get(col, {}).get("mode","(none)"))
             )
         with cc2:
             value = st.text_input(
@@ -210,9 +442,9 @@ with left:
     keep_latest_only = st.toggle("Keep only latest per PVNumber", value=st.session_state.get("keep_latest_only", False))
     st.session_state.keep_latest_only = keep_latest_only
 with right:
-    if base["CodeDate_num"].notna().any():
-        min_v = int(pd.to_numeric(base["CodeDate_num"], errors="coerce").min())
-        max_v = int(pd.to_numeric(base["CodeDate_num"], errors="coerce").max())
+    codedate_range = base.attrs.get("codedate_range")
+    if codedate_range:
+        min_v, max_v = (int(v) for v in codedate_range)
         dv1, dv2 = st.columns(2)
         with dv1:
             min_str = st.text_input("Code Date min (numeric)", value=str(min_v))
@@ -222,45 +454,62 @@ with right:
         min_str = max_str = ""
 
 q = st.session_state.get("query","").strip().lower()
-mask = pd.Series(True, index=base.index)
-if q:
-    mm = pd.Series(False, index=base.index)
-    for col in REQUIRED_COLUMNS:
-        mm = mm | base[col].astype(str).str.lower().str.contains(q, na=False)
-    mask &= mm
+adv_filters = st.session_state.adv_filters
+mask = np.ones(len(base), dtype=bool)
 
+# Cheap exact predicates first, so the substring scans below see fewer rows.
 for col, selected in st.session_state.basic_filters.items():
     if selected:
-        mask &= base[col].astype(str).isin(selected)
-
-for col, cond in st.session_state.adv_filters.items():
-    mode = cond["mode"]; val = cond["value"]
-    series = base[col].astype(str)
-    if mode == "contains":
-        mask &= series.str.contains(val, case=False, na=False)
-    elif mode == "equals":
-        mask &= series.str.lower() == val.lower()
-    elif mode == "in list":
-        items = [v.strip() for v in val.split(";") if v.strip()]
-        mask &= series.isin(items)
+        series = base[col]
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(str)
+        np.logical_and(mask, _as_bool(series.isin(selected)), out=mask)
+
+for col, cond in adv_filters.items():
+    if cond["mode"] == "equals":
+        np.logical_and(mask, _as_bool(base[LOWER_PREFIX + col] == cond["value"].lower()), out=mask)
+
+for col, cond in adv_filters.items():
+    if cond["mode"] == "in list":
+        items = _parse_in_list(cond["value"])
+        np.logical_and(mask, _as_bool(base[col].astype(str).isin(items)), out=mask)
 
 if min_str and max_str:
     try:
         min_n = float(min_str); max_n = float(max_str)
-        mask &= (base["CodeDate_num"].astype(float) >= min_n) & (base["CodeDate_num"].astype(float) <= max_n)
-    except Exception:
+    except ValueError:
         pass
+    else:
+        cd = np.ascontiguousarray(base["CodeDate_num"].to_numpy(dtype=np.float64, copy=False))
+        and_in_range(mask, cd, min_n, max_n)
 
-filtered = base[mask].copy()
-if keep_latest_only:
-    filtered.sort_values(["PVNumber","CodeDate_num"], ascending=[True, False], inplace=True)
-    filtered = filtered.drop_duplicates(subset=["PVNumber"], keep="first")
-
-display_df = filtered[REQUIRED_COLUMNS].copy()
-display_df["CodeDate (num)"] = filtered["CodeDate_num"]
+for col, cond in adv_filters.items():
+    if cond["mode"] == "contains":
+        _and_contains(mask, base[LOWER_PREFIX + col], cond["value"].lower())
+    elif cond["mode"] == "regex":
+        try:
+            re.compile(cond["value"])
+        except re.error as e:
+            st.warning(f"Invalid regex for {col}: {e}")
+            continue
+        _and_contains(mask, base[LOWER_PREFIX + col], cond["value"], regex=True)
 
-st.write(f"Results: **{len(display_df)}** records")
-st.dataframe(display_df, use_container_width=True, hide_index=True)
+if q:
+    _and_search(mask, base, q)
 
-_download_xlsx(display_df, "PV_Finder_Results.xlsx")
-_download_csv(display_df, "PV_Finder_Results.csv")
+rows = np.flatnonzero(mask)
+if keep_latest_only:
+    rows = _latest_rows(base, rows)
+total = len(rows)
+st.write(f"Results: **{total}** records")
+
+# Only the visible page is materialized and shipped to the browser.
+n_pages = max(1, -(-total // PAGE_SIZE))
+page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+start = (page - 1) * PAGE_SIZE
+st.dataframe(_display_frame(base, rows[start:start + PAGE_SIZE]), use_container_width=True, hide_index=True)
+
+if st.toggle("Prepare downloads (all results)", key="prepare_downloads"):
+    display_df = _display_frame(base, rows)
+    _download_xlsx(display_df, "PV_Finder_Results.xlsx")
+    _download_csv(display_df, "PV_Finder_Results.csv")
@@ -0,0 +1,53 @@
+# pv_kernels.py
+# Compiled helpers for PV Finder. Kept out of the Streamlit script, which is re-executed on
+# every interaction, so the kernels are compiled (or loaded from numba's cache) once per process.
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+except ImportError:  # numba is optional; global search falls back to pandas
+    njit = None
+
+if njit is not None:
+    def _ro(dtype):
+        # Inputs may be read-only (np.frombuffer over bytes, copy-on-write views).
+        return types.Array(dtype, 1, "C", readonly=True)
+
+    # Eagerly compiled (explicit signature, on-disk cache) so the first keystroke pays no JIT cost.
+    @njit(types.boolean[::1](_ro(types.uint8), _ro(types.int64), _ro(types.int64), _ro(types.uint8)),
+          parallel=True, cache=True)
+    def contains_rows(hay, offsets, rows, needle):
+        # Boyer-Moore-Horspool search of needle within hay[offsets[r]:offsets[r + 1]] for each r in rows.
+        n = needle.shape[0]
+        skip = np.full(256, n, dtype=np.int64)
+        for j in range(n - 1):
+            skip[needle[j]] = n - 1 - j
+        out = np.zeros(rows.shape[0], dtype=np.bool_)
+        for k in prange(rows.shape[0]):
+            r = rows[k]
+            pos = offsets[r]
+            last = offsets[r + 1] - n
+            while pos <= last:
+                j = n - 1
+                while j >= 0 and hay[pos + j] == needle[j]:
+                    j -= 1
+                if j < 0:
+                    out[k] = True
+                    break
+                pos += skip[hay[pos + n - 1]]
+        return out
+
+    @njit(types.void(types.boolean[::1], _ro(types.float64), types.float64, types.float64),
+          parallel=True, cache=True)
+    def and_in_range(mask, values, lo, hi):
+        # Fused range check + mask AND in one pass; NaN compares False and drops out.
+        for i in prange(mask.shape[0]):
+            if mask[i]:
+                v = values[i]
+                mask[i] = v >= lo and v <= hi
+else:
+    contains_rows = None
+
+    def and_in_range(mask, values, lo, hi):
+        np.logical_and(mask, (values >= lo) & (values <= hi), out=mask)